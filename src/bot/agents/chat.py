@@ -79,6 +79,7 @@ async def build_chat_agent() -> AsyncIterator[Agent]:
     async with MCPServerManager(
         mcp_servers,
         connect_timeout_seconds=settings.mcp_connect_timeout,
+        connect_in_parallel=True,
     ) as manager:
         agent = Agent(
             name="chat-agent",
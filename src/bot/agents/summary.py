@@ -1,12 +1,12 @@
-import asyncio
-
 from agents import Agent
 from agents import Runner
 
 from bot.core import MessageResponse
 from bot.core.prompt_template import PromptTemplate
 from bot.provider import get_openai_model
+from bot.settings import settings
 from bot.utils.chunk import recursive_chunk
+from bot.utils.concurrency import gather_with_limit
 
 INSTRUCTIONS = PromptTemplate(
     template="""
@@ -78,5 +78,5 @@ async def summarize(text: str) -> MessageResponse:
     if len(chunks) == 1:
         return await _summarize(text)
 
-    articles = await asyncio.gather(*[_summarize(chunk) for chunk in chunks])
+    articles = await gather_with_limit([_summarize(chunk) for chunk in chunks], settings.agent_chunk_concurrency)
     return await _summarize("\n\n".join([article.content for article in articles]))
@@ -1,3 +1,5 @@
+import hashlib
+from collections import OrderedDict
 from functools import cache
 from typing import Final
 
@@ -9,6 +11,7 @@ from bot.core.prompt_template import PromptTemplate
 from bot.provider import get_openai_model
 
 DEFAULT_TARGET_LANG: Final[str] = "台灣正體中文"
+TRANSLATION_CACHE_SIZE: Final[int] = 1024
 INSTRUCTIONS = PromptTemplate(
     template="""
 # Role
@@ -64,7 +67,26 @@ def build_translation_agent(lang: str = DEFAULT_TARGET_LANG) -> Agent:
     )
 
 
+_translation_cache: OrderedDict[tuple[bytes, str], MessageResponse] = OrderedDict()
+
+
+def _cache_key(text: str, lang: str) -> tuple[bytes, str]:
+    # Hash the text so long inputs do not stay alive as cache keys.
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), lang
+
+
 async def translate(text: str, lang: str = DEFAULT_TARGET_LANG) -> MessageResponse:
+    key = _cache_key(text, lang)
+    cached = _translation_cache.get(key)
+    if cached is not None:
+        _translation_cache.move_to_end(key)
+        return cached.model_copy()
+
     agent = build_translation_agent(lang=lang)
     result = await Runner.run(agent, input=text)
-    return result.final_output_as(MessageResponse)
+    response = result.final_output_as(MessageResponse)
+
+    _translation_cache[key] = response.model_copy()
+    if len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+        _translation_cache.popitem(last=False)
+    return response
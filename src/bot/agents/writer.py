@@ -1,4 +1,3 @@
-import asyncio
 import html
 import logging
 
@@ -7,11 +6,14 @@ from agents import Agent
 from agents import Runner
 from aiogram.types import Message
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 
 from bot.core.prompt_template import PromptTemplate
 from bot.provider import get_openai_model
+from bot.settings import settings
 from bot.utils.chunk import recursive_chunk
+from bot.utils.concurrency import gather_with_limit
 from bot.utils.page import async_create_page
 
 logger = logging.getLogger(__name__)
@@ -47,6 +49,8 @@ Final checks:
 
 
 class Section(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="The title of the section.")
     emoji: str = Field(..., description="An emoji to represent the section.")
     content: str = Field(
@@ -59,6 +63,8 @@ class Section(BaseModel):
 
 
 class Article(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="The title of the article.")
     summary: str = Field(..., description="A brief summary of the article.")
     sections: list[Section] = Field(..., description="A list of sections in the article.")
@@ -103,7 +109,8 @@ async def write_article(text: str) -> Article:
     if len(chunks) == 1:
         return await _write_article(text)
 
-    articles = await asyncio.gather(
-        *[_write_article(chunk) for chunk in chunks],
+    articles = await gather_with_limit(
+        [_write_article(chunk) for chunk in chunks],
+        settings.agent_chunk_concurrency,
     )
     return await write_article("\n\n".join([article.render_content_text() for article in articles]))
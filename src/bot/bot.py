@@ -38,8 +38,10 @@ def get_chat_filter() -> Callable[[Message], bool]:
         logger.warning("No whitelist specified, allowing all chats")
         return lambda _: True
 
+    allowed_chat_ids = frozenset(chat_ids)
+
     def chat_filter(message: Message) -> bool:
-        return message.chat.id in chat_ids
+        return message.chat.id in allowed_chat_ids
 
     return chat_filter
 
@@ -9,6 +9,8 @@ from bot.utils import load_url
 
 logger = logging.getLogger(__name__)
 
+_URL_PATTERN = re.compile(r"https?://[^\s]+")
+
 
 def parse_url(s: str) -> str:
     """Parse the first URL from the given string.
@@ -19,9 +21,7 @@ def parse_url(s: str) -> str:
     Returns:
         The first URL found in the string, or empty string if no URL found
     """
-    url_pattern = r"https?://[^\s]+"
-
-    match = re.search(url_pattern, s)
+    match = _URL_PATTERN.search(s)
     if match:
         return match.group(0)
 
@@ -37,8 +37,7 @@ def parse_urls(s: str) -> list[str]:
     Returns:
         List of URLs found in the string
     """
-    url_pattern = r"https?://[^\s]+"
-    return re.findall(url_pattern, s)
+    return _URL_PATTERN.findall(s)
 
 
 def get_user_display_name(message: Message) -> str | None:
@@ -152,8 +151,7 @@ def strip_command(text: str) -> str:
     Output: "hello"
     """
     if text.startswith("/"):
-        _command, *args = text.split(" ", 1)
-        return args[0] if args else ""
+        return text.partition(" ")[2]
     return text
 
 
@@ -201,18 +199,28 @@ async def get_processed_message_text(
     # 嘗試載入所有 URL
     logger.info("Parsed URLs: %s", urls)
     try:
-        # 並行載入所有 URL
-        contents = await asyncio.gather(*[load_url(url) for url in urls])
+        # 並行載入所有 URL，逐一收集結果以便只回報失敗的 URL
+        results = await asyncio.gather(*[load_url(url) for url in urls], return_exceptions=True)
     except asyncio.CancelledError:
         logger.debug("URL loading cancelled.")
         raise
-    except Exception as e:
-        error_msg = f"Failed to load URL(s): {', '.join(urls)}"
-        logger.warning("%s, got error: %s", error_msg, e)
-        return None, error_msg
-    else:
-        combined_content = append_url_contents(message_text, list(zip(urls, contents, strict=True)))
-        return combined_content, None
+
+    url_contents: list[tuple[str, str]] = []
+    failed_urls: list[str] = []
+    for url, result in zip(urls, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning("Failed to load URL %s, got error: %s", url, result)
+            failed_urls.append(url)
+            continue
+        # Cancellation and other non-Exception errors (KeyboardInterrupt, SystemExit) must propagate.
+        if isinstance(result, BaseException):
+            raise result
+        url_contents.append((url, result))
+
+    if failed_urls:
+        return None, f"Failed to load URL(s): {', '.join(failed_urls)}"
+
+    return append_url_contents(message_text, url_contents), None
 
 
 def safe_callback(callback_func):
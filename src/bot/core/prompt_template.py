@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from textwrap import dedent
 
 
@@ -6,9 +7,15 @@ def _normalize(text: str) -> str:
     return dedent(text).strip()
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=128)
+def _render(template: str, items: tuple[tuple[str, str], ...]) -> str:
+    return _normalize(template.format_map(dict(items)))
+
+
+@dataclass(frozen=True, slots=True)
 class PromptTemplate:
     template: str
 
     def render(self, **kwargs: str) -> str:
-        return _normalize(self.template.format(**kwargs))
+        # Agents are rebuilt per request with the same arguments, so reuse the rendered prompt.
+        return _render(self.template, tuple(sorted(kwargs.items())))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
@@ -21,6 +23,7 @@ class Settings(BaseSettings):
     # Agent settings
     agent_max_cache_size: int = Field(default=50)
     agent_reply_enabled: bool = Field(default=False)
+    agent_chunk_concurrency: int = Field(default=8, ge=1)
 
     # OpenAI / LLM settings
     openai_model: str = Field(default="gpt-5-mini")
@@ -48,7 +51,19 @@ class Settings(BaseSettings):
     def chat_ids(self) -> list[int] | None:
         if not self.bot_whitelist:
             return None
-        return [int(chat_id.strip()) for chat_id in self.bot_whitelist.replace(" ", "").split(",")]
+        return list(_parse_chat_ids(self.bot_whitelist))
+
+
+_WHITESPACE_TABLE = str.maketrans("", "", " \t\r\n")
+
+
+@lru_cache(maxsize=8)
+def _parse_chat_ids(whitelist: str) -> tuple[int, ...]:
+    chat_ids = tuple(int(chat_id) for chat_id in whitelist.translate(_WHITESPACE_TABLE).split(",") if chat_id)
+    # A non-empty whitelist without any ids is a misconfiguration; fail closed instead of allowing all chats.
+    if not chat_ids:
+        raise ValueError(f"BOT_WHITELIST contains no chat ids: {whitelist!r}")
+    return chat_ids
 
 
 settings = Settings()
@@ -1,4 +1,5 @@
 from .chunk import recursive_chunk
+from .concurrency import gather_with_limit
 from .file_io import load_json
 from .file_io import save_json
 from .file_io import save_text
@@ -13,6 +14,7 @@ __all__ = [
     "chunk_on_delimiter",
     "configure_logging",
     "create_page",
+    "gather_with_limit",
     "is_retryable_error",
     "load_json",
     "load_url",
@@ -1,10 +1,19 @@
+from functools import cache
+
 from chonkie import RecursiveChunker
 
 
-def recursive_chunk(text: str, chunk_size: int = 200_000) -> list[str]:
-    chunker = RecursiveChunker(
+@cache
+def _get_chunker(chunk_size: int) -> RecursiveChunker:
+    return RecursiveChunker(
         tokenizer="character",
         chunk_size=chunk_size,
     )
-    chunks = chunker.chunk(text)
+
+
+def recursive_chunk(text: str, chunk_size: int = 200_000) -> list[str]:
+    # Most inputs fit in a single chunk; skip the chunker entirely for them.
+    if 0 < len(text) <= chunk_size:
+        return [text]
+    chunks = _get_chunker(chunk_size).chunk(text)
     return [chunk.text for chunk in chunks]
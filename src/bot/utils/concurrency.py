@@ -0,0 +1,23 @@
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Iterable
+
+
+async def gather_with_limit[T](aws: Iterable[Awaitable[T]], limit: int) -> list[T]:
+    """
+    Await all awaitables concurrently with at most `limit` in flight.
+
+    Args:
+        aws: Awaitables to run
+        limit: Maximum number of awaitables running at the same time
+
+    Returns:
+        Results in the same order as `aws`
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*[_run(aw) for aw in aws])
@@ -1,14 +1,34 @@
+from __future__ import annotations
+
 import asyncio
+import threading
 from html import escape as html_escape
 from html.parser import HTMLParser
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import telegraph
+
 
-import telegraph
+_telegraph_client: telegraph.Telegraph | None = None
+_telegraph_client_lock = threading.Lock()
 
 
 def get_telegraph_client() -> telegraph.Telegraph:
-    client = telegraph.Telegraph()
-    client.create_account(short_name="Narumi's Bot")
-    return client
+    # Shared so the account is created once and the client's HTTP session keeps its connections alive.
+    # create_page() runs in to_thread workers, so creation is locked; the shared client is then used
+    # from several threads at once, relying on requests.Session being safe for independent requests.
+    global _telegraph_client
+    if _telegraph_client is None:
+        with _telegraph_client_lock:
+            if _telegraph_client is None:
+                # Imported lazily: only long replies reach Telegraph, so most processes never need the SDK.
+                import telegraph
+
+                client = telegraph.Telegraph()
+                client.create_account(short_name="Narumi's Bot")
+                _telegraph_client = client
+    return _telegraph_client
 
 
 _TELEGRAPH_ALLOWED_TAGS: set[str] = {
@@ -0,0 +1,22 @@
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from bot.agents import chat
+from bot.agents.chat import build_chat_agent
+
+
+@patch.object(chat, "get_openai_model", return_value="gpt-test")
+@patch.object(chat, "_build_mcp_servers", return_value=[])
+@patch.object(chat, "MCPServerManager")
+async def test_build_chat_agent_connects_mcp_servers_in_parallel(
+    mock_manager, mock_build_mcp_servers, mock_get_openai_model
+):
+    manager = mock_manager.return_value
+    manager.__aenter__ = AsyncMock(return_value=manager)
+    manager.__aexit__ = AsyncMock(return_value=None)
+    manager.active_servers = []
+
+    async with build_chat_agent() as agent:
+        assert agent.name == "chat-agent"
+
+    assert mock_manager.call_args.kwargs["connect_in_parallel"] is True
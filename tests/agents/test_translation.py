@@ -0,0 +1,71 @@
+from collections.abc import Iterator
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from bot.agents import translation
+from bot.agents.translation import translate
+from bot.core.message_response import MessageResponse
+
+
+@pytest.fixture(autouse=True)
+def clear_translation_cache():
+    translation._translation_cache.clear()
+    yield
+    translation._translation_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def mock_runner() -> Iterator[Mock]:
+    with (
+        patch.object(translation, "build_translation_agent"),
+        patch.object(translation, "Runner") as runner,
+    ):
+        yield runner
+
+
+def _runner_result(content: str) -> Mock:
+    result = Mock()
+    result.final_output_as.return_value = MessageResponse(content=content)
+    return result
+
+
+async def test_translate_cache_hit(mock_runner):
+    mock_runner.run = AsyncMock(return_value=_runner_result("こんにちは"))
+
+    first = await translate("你好", lang="日本語")
+    second = await translate("你好", lang="日本語")
+
+    assert mock_runner.run.call_count == 1
+    assert first.content == second.content == "こんにちは"
+
+
+async def test_translate_cache_keyed_on_lang(mock_runner):
+    mock_runner.run = AsyncMock(side_effect=[_runner_result("こんにちは"), _runner_result("Hello")])
+
+    assert (await translate("你好", lang="日本語")).content == "こんにちは"
+    assert (await translate("你好", lang="English")).content == "Hello"
+    assert mock_runner.run.call_count == 2
+
+
+async def test_translate_cache_evicts_least_recently_used(mock_runner):
+    mock_runner.run = AsyncMock(side_effect=lambda agent, input: _runner_result(input))
+
+    with patch.object(translation, "TRANSLATION_CACHE_SIZE", 2):
+        await translate("a")
+        await translate("b")
+        assert mock_runner.run.call_count == 2
+
+        await translate("a")  # hit: "a" becomes most recently used
+        assert mock_runner.run.call_count == 2
+
+        await translate("c")  # evicts "b", the least recently used
+        assert mock_runner.run.call_count == 3
+
+        await translate("a")  # still cached
+        assert mock_runner.run.call_count == 3
+
+        await translate("b")  # evicted, so it runs again
+        assert mock_runner.run.call_count == 4
@@ -0,0 +1,18 @@
+from bot.agents.writer import Article
+from bot.agents.writer import Section
+
+
+def test_article_render_content_text_joins_sections():
+    article = Article(
+        title="測試文章",
+        summary="摘要",
+        sections=[
+            Section(title="開頭", emoji="📝", content="第一段"),
+            Section(title="結尾", emoji="✅", content="第二段"),
+        ],
+    )
+
+    assert article.render_content_text() == "📝 開頭\n\n第一段\n\n✅ 結尾\n\n第二段"
+
+    updated = article.model_copy(update={"sections": [Section(title="新段落", emoji="🆕", content="新內容")]})
+    assert updated.render_content_text() == "🆕 新段落\n\n新內容"
@@ -0,0 +1,25 @@
+import httpx
+import pytest
+from aiogram.types import Chat
+from aiogram.types import User
+
+
+@pytest.fixture(autouse=True)
+def block_httpx_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail fast if a callback test reaches the network through an unpatched httpx client."""
+
+    async def send(self: httpx.AsyncClient, request: httpx.Request, **kwargs: object) -> httpx.Response:
+        raise RuntimeError(f"Unexpected network access in tests: {request.method} {request.url}")
+
+    monkeypatch.setattr(httpx.AsyncClient, "send", send)
+
+
+# aiogram models are frozen, so one instance can be shared across the whole session.
+@pytest.fixture(scope="session")
+def test_user() -> User:
+    return User(id=123, is_bot=False, first_name="TestUser", username="testuser")
+
+
+@pytest.fixture(scope="session")
+def test_chat() -> Chat:
+    return Chat(id=456, type="private")
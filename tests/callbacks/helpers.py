@@ -0,0 +1,25 @@
+import asyncio
+from unittest.mock import Mock
+
+from aiogram.types import Message
+
+# Computed once: `Mock(spec=Message)` re-walks every attribute of the pydantic model on each construction.
+_MESSAGE_SPEC: list[str] = dir(Message)
+
+
+def noop_async_mock() -> Mock:
+    """Return a mock for an awaited method whose result is ignored.
+
+    The mock returns an already completed future instead of building a coroutine per call like `AsyncMock`.
+    A done future can be awaited any number of times. Must be called while an event loop is running.
+    """
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(None)
+    return Mock(return_value=future)
+
+
+def make_message() -> Mock:
+    """Return a `Message` double that passes `isinstance(..., Message)` checks."""
+    message = Mock(spec=_MESSAGE_SPEC)
+    message.__class__ = Message
+    return message
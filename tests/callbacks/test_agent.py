@@ -4,10 +4,13 @@ from unittest.mock import Mock
 from unittest.mock import patch
 
 from agents import TResponseInputItem
-from aiogram.types import Message
 from aiogram.types import User
 
+from bot.callbacks import agent
+from bot.callbacks import utils
 from bot.callbacks.agent import AgentCallback
+from tests.callbacks.helpers import make_message
+from tests.callbacks.helpers import noop_async_mock
 
 # AgentCallback setup
 
@@ -34,8 +37,8 @@ def test_agent_callback_init_default_cache_size():
 # handle_message
 
 
-@patch("bot.callbacks.agent.get_processed_message_text")
-@patch("bot.callbacks.agent.Runner")
+@patch.object(agent, "get_processed_message_text")
+@patch.object(agent, "Runner")
 async def test_handle_message_simple(mock_runner, mock_get_processed_message_text):
     mock_agent = Mock()
     mock_get_processed_message_text.return_value = ("Hello, how are you?", None)
@@ -73,7 +76,7 @@ async def test_handle_message_simple(mock_runner, mock_get_processed_message_tex
     assert callback.memory["12345"] == mock_result.to_input_list.return_value
 
 
-@patch("bot.callbacks.agent.get_processed_message_text")
+@patch.object(agent, "get_processed_message_text")
 async def test_handle_message_empty_text(mock_get_processed_message_text):
     mock_agent = Mock()
 
@@ -86,8 +89,8 @@ async def test_handle_message_empty_text(mock_get_processed_message_text):
     mock_get_processed_message_text.assert_called_once()
 
 
-@patch("bot.callbacks.agent.get_processed_message_text")
-@patch("bot.callbacks.agent.Runner")
+@patch.object(agent, "get_processed_message_text")
+@patch.object(agent, "Runner")
 async def test_memory_isolated_between_chats(mock_runner, mock_get_processed_message_text):
     mock_agent = Mock()
     mock_get_processed_message_text.return_value = ("Test message", None)
@@ -130,8 +133,8 @@ async def test_memory_isolated_between_chats(mock_runner, mock_get_processed_mes
     assert callback.memory["67890"] == second_result.to_input_list.return_value
 
 
-@patch("bot.callbacks.agent.get_processed_message_text")
-@patch("bot.callbacks.agent.Runner")
+@patch.object(agent, "get_processed_message_text")
+@patch.object(agent, "Runner")
 async def test_memory_persists_by_chat_id(mock_runner, mock_get_processed_message_text):
     mock_agent = Mock()
     existing_messages = [
@@ -171,8 +174,8 @@ async def test_memory_persists_by_chat_id(mock_runner, mock_get_processed_messag
     assert input_messages[2]["content"] == "New message"
 
 
-@patch("bot.callbacks.agent.get_processed_message_text")
-@patch("bot.callbacks.agent.Runner")
+@patch.object(agent, "get_processed_message_text")
+@patch.object(agent, "Runner")
 async def test_memory_trimmed_to_max_cache_size(mock_runner, mock_get_processed_message_text):
     mock_agent = Mock()
     mock_get_processed_message_text.return_value = ("New message", None)
@@ -216,7 +219,7 @@ def _build_message(
     message.from_user = user or User(id=123, is_bot=False, first_name="TestUser", username="testuser")
     message.reply_to_message = reply_to_message
     message.chat.id = chat_id
-    message.reply = AsyncMock()
+    message.reply = noop_async_mock()
     return message
 
 
@@ -231,8 +234,8 @@ def _build_runner_result() -> Mock:
     return result
 
 
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.agent.Runner")
+@patch.object(utils, "load_url")
+@patch.object(agent, "Runner")
 async def test_handle_message_reply_keeps_reply_and_current_text(mock_runner, mock_load_url):
     mock_runner.run = AsyncMock(return_value=_build_runner_result())
     mock_load_url.return_value = "unused"
@@ -250,8 +253,8 @@ async def test_handle_message_reply_keeps_reply_and_current_text(mock_runner, mo
     )
 
 
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.agent.Runner")
+@patch.object(utils, "load_url")
+@patch.object(agent, "Runner")
 async def test_handle_message_reply_with_current_url_keeps_current_text_in_runner_input(mock_runner, mock_load_url):
     mock_runner.run = AsyncMock(return_value=_build_runner_result())
     mock_load_url.return_value = "Loaded URL content"
@@ -270,8 +273,8 @@ async def test_handle_message_reply_with_current_url_keeps_current_text_in_runne
     )
 
 
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.agent.Runner")
+@patch.object(utils, "load_url")
+@patch.object(agent, "Runner")
 async def test_handle_message_reply_with_reply_url_does_not_drop_current_text(mock_runner, mock_load_url):
     mock_runner.run = AsyncMock(return_value=_build_runner_result())
     mock_load_url.return_value = "Loaded URL content"
@@ -293,10 +296,10 @@ async def test_handle_message_reply_with_reply_url_does_not_drop_current_text(mo
 # handle_command
 
 
-@patch("bot.callbacks.agent.trace")
+@patch.object(agent, "trace")
 async def test_handle_command(mock_trace):
     mock_agent = Mock()
-    mock_message = Mock(spec=Message)
+    mock_message = make_message()
 
     callback = AgentCallback(mock_agent)
     with patch.object(callback, "handle_message", new_callable=AsyncMock) as mock_handle_message:
@@ -317,7 +320,7 @@ async def test_handle_reply_disabled_by_default():
     mock_reply_message = Mock()
     mock_reply_message.from_user = mock_bot_user
 
-    mock_message = Mock(spec=Message)
+    mock_message = make_message()
     mock_message.reply_to_message = mock_reply_message
     mock_message.bot.id = 42
 
@@ -327,7 +330,7 @@ async def test_handle_reply_disabled_by_default():
     mock_handle_message.assert_not_called()
 
 
-@patch("bot.callbacks.agent.trace")
+@patch.object(agent, "trace")
 async def test_handle_reply_valid_reply_to_this_bot(mock_trace):
     mock_agent = Mock()
 
@@ -338,7 +341,7 @@ async def test_handle_reply_valid_reply_to_this_bot(mock_trace):
     mock_reply_message = Mock()
     mock_reply_message.from_user = mock_bot_user
 
-    mock_message = Mock(spec=Message)
+    mock_message = make_message()
     mock_message.reply_to_message = mock_reply_message
     mock_message.bot.id = 42
 
@@ -359,7 +362,7 @@ async def test_handle_reply_to_other_bot_is_ignored():
     mock_reply_message = Mock()
     mock_reply_message.from_user = mock_other_bot_user
 
-    mock_message = Mock(spec=Message)
+    mock_message = make_message()
     mock_message.reply_to_message = mock_reply_message
     mock_message.bot.id = 42
 
@@ -379,7 +382,7 @@ async def test_handle_reply_not_bot_reply():
     mock_reply_message = Mock()
     mock_reply_message.from_user = mock_human_user
 
-    mock_message = Mock(spec=Message)
+    mock_message = make_message()
     mock_message.reply_to_message = mock_reply_message
     mock_message.bot.id = 42
 
@@ -392,7 +395,7 @@ async def test_handle_reply_not_bot_reply():
 async def test_handle_reply_no_reply_message():
     mock_agent = Mock()
 
-    mock_message = Mock(spec=Message)
+    mock_message = make_message()
     mock_message.reply_to_message = None
 
     callback = AgentCallback(mock_agent, reply_enabled=True)
@@ -1,18 +1,18 @@
+from pathlib import Path
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
-import pytest
 from aiogram import Bot
 from aiogram.types import Document
-from aiogram.types import Message
 
+from bot.callbacks import file_notes
 from bot.callbacks.file_notes import file_callback
+from tests.callbacks.helpers import make_message
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.file_notes.write_article", new_callable=AsyncMock)
-@patch("bot.callbacks.file_notes.read_pdf_content")
+@patch.object(file_notes, "write_article", new_callable=AsyncMock)
+@patch.object(file_notes, "read_pdf_content")
 async def test_file_callback_reads_pdf_with_injected_bot(mock_read_pdf_content, mock_write_article, tmp_path):
     file_path = tmp_path / "note.pdf"
     file_path.write_text("pdf bytes")
@@ -22,8 +22,11 @@ async def test_file_callback_reads_pdf_with_injected_bot(mock_read_pdf_content,
     article.reply = AsyncMock()
     mock_write_article.return_value = article
 
+    async def download_to_drive() -> Path:
+        return file_path
+
     file = Mock()
-    file.download_to_drive = AsyncMock(return_value=file_path)
+    file.download_to_drive = download_to_drive
 
     bot = Mock(spec=Bot)
     bot.get_file = AsyncMock(return_value=file)
@@ -31,7 +34,7 @@ async def test_file_callback_reads_pdf_with_injected_bot(mock_read_pdf_content,
     document = Mock(spec=Document)
     document.file_id = "file-id"
 
-    message = Mock(spec=Message)
+    message = make_message()
     message.document = document
 
     await file_callback(message, bot)
@@ -1,29 +1,25 @@
 import json
 from typing import cast
-from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
-import pytest
 from aiogram.enums import ParseMode
 from aiogram.types import Message
 from aiogram.types import User
 from twse.stock_info import StockInfo
 
+from bot.callbacks import ticker
 from bot.callbacks.ticker import _query_twse
 from bot.callbacks.ticker import query_ticker_callback
+from tests.callbacks.helpers import make_message
+from tests.callbacks.helpers import noop_async_mock
 
 
-@pytest.fixture
-def test_user() -> User:
-    return User(id=123, is_bot=False, first_name="TestUser", username="testuser")
-
-
-def _message(text: str, test_user: User) -> tuple[Message, AsyncMock]:
-    message = Mock(spec=Message)
+def _message(text: str, test_user: User) -> tuple[Message, Mock]:
+    message = make_message()
     message.text = text
     message.from_user = test_user
-    answer = AsyncMock()
+    answer = noop_async_mock()
     message.answer = answer
     return cast(Message, message), answer
 
@@ -35,7 +31,6 @@ def _stock_response(symbol: str, name: str) -> tuple[Mock, str]:
     return Mock(msg_array=[stock]), stock.pretty_repr()
 
 
-@pytest.mark.asyncio
 async def test_query_ticker_callback_no_args(test_user: User):
     message, _answer = _message("/ticker", test_user)
 
@@ -43,8 +38,7 @@ async def test_query_ticker_callback_no_args(test_user: User):
     assert result is None
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.ticker.get_stock_info")
+@patch.object(ticker, "get_stock_info")
 async def test_query_twse_escapes_markdown_in_stock_name(mock_get_stock_info):
     stock = StockInfo.model_validate(
         {"c": "2327", "n": "國巨*", "o": 663, "h": 666, "l": 630, "z": 630, "y": 699, "v": 30727, "ex": "tse"}
@@ -57,9 +51,8 @@ async def test_query_twse_escapes_markdown_in_stock_name(mock_get_stock_info):
     assert result[0].startswith("📊 *國巨\\* \\(2327\\)*")
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.ticker.query_tickers")
-@patch("bot.callbacks.ticker.get_stock_info")
+@patch.object(ticker, "query_tickers")
+@patch.object(ticker, "get_stock_info")
 async def test_query_ticker_callback_success(mock_get_stock_info, mock_query_tickers, test_user: User):
     mock_query_tickers.return_value = "Yahoo Finance result for AAPL"
 
@@ -77,9 +70,8 @@ async def test_query_ticker_callback_success(mock_get_stock_info, mock_query_tic
     answer.assert_called_once_with(expected_result, parse_mode=ParseMode.MARKDOWN_V2)
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.ticker.query_tickers")
-@patch("bot.callbacks.ticker.get_stock_info")
+@patch.object(ticker, "query_tickers")
+@patch.object(ticker, "get_stock_info")
 async def test_query_ticker_callback_yahoo_finance_error(mock_get_stock_info, mock_query_tickers, test_user: User):
     mock_query_tickers.side_effect = Exception("Yahoo Finance API error")
 
@@ -97,9 +89,8 @@ async def test_query_ticker_callback_yahoo_finance_error(mock_get_stock_info, mo
     answer.assert_called_once_with(expected_result, parse_mode=ParseMode.MARKDOWN_V2)
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.ticker.query_tickers")
-@patch("bot.callbacks.ticker.get_stock_info")
+@patch.object(ticker, "query_tickers")
+@patch.object(ticker, "get_stock_info")
 async def test_query_ticker_callback_twse_error(mock_get_stock_info, mock_query_tickers, test_user: User):
     mock_query_tickers.return_value = "Yahoo Finance result for AAPL"
     mock_get_stock_info.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
@@ -115,9 +106,8 @@ async def test_query_ticker_callback_twse_error(mock_get_stock_info, mock_query_
     answer.assert_called_once_with(expected_result, parse_mode=ParseMode.MARKDOWN_V2)
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.ticker.query_tickers")
-@patch("bot.callbacks.ticker.get_stock_info")
+@patch.object(ticker, "query_tickers")
+@patch.object(ticker, "get_stock_info")
 async def test_query_ticker_callback_multiple_symbols(mock_get_stock_info, mock_query_tickers, test_user: User):
     mock_query_tickers.return_value = "Yahoo Finance results"
 
@@ -137,9 +127,8 @@ async def test_query_ticker_callback_multiple_symbols(mock_get_stock_info, mock_
     answer.assert_called_once_with(expected_result, parse_mode=ParseMode.MARKDOWN_V2)
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.ticker.query_tickers")
-@patch("bot.callbacks.ticker.get_stock_info")
+@patch.object(ticker, "query_tickers")
+@patch.object(ticker, "get_stock_info")
 async def test_query_ticker_callback_no_results(mock_get_stock_info, mock_query_tickers, test_user: User):
     mock_query_tickers.side_effect = Exception("No data")
     mock_get_stock_info.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
@@ -149,7 +138,4 @@ async def test_query_ticker_callback_no_results(mock_get_stock_info, mock_query_
     result = await query_ticker_callback(message)
 
     assert result is None
-    answer.assert_called_once()
-    call_args = answer.call_args[0][0]
-    assert "無法查詢到股票代碼" in call_args
-    assert "INVALID" in call_args
+    answer.assert_called_once_with("無法查詢到股票代碼 INVALID 的資訊。\n請確認代碼是否正確，或稍後再試。")
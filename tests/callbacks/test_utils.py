@@ -1,22 +1,30 @@
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
 from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
-from aiogram.types import Message
+from aiogram.types import Chat
 from aiogram.types import User
 
+from bot.callbacks import utils
 from bot.callbacks.utils import get_message_key
 from bot.callbacks.utils import get_message_text
 from bot.callbacks.utils import get_processed_message_text
 from bot.callbacks.utils import get_user_display_name
+from bot.callbacks.utils import parse_urls
 from bot.callbacks.utils import safe_callback
 from bot.callbacks.utils import strip_command
+from tests.callbacks.helpers import make_message
+from tests.callbacks.helpers import noop_async_mock
 
 
-@pytest.fixture
-def test_user() -> User:
-    return User(id=123, is_bot=False, first_name="TestUser", username="testuser")
+def _build_message(
+    text: str | None,
+    user: User,
+    *,
+    reply_to_message: SimpleNamespace | None = None,
+) -> SimpleNamespace:
+    return SimpleNamespace(text=text, caption=None, from_user=user, reply_to_message=reply_to_message)
 
 
 @pytest.mark.parametrize(
@@ -36,135 +44,90 @@ def test_strip_command(text, expected):
     assert strip_command(text) == expected
 
 
-def test_get_user_display_name_with_username():
-    user = User(id=123, is_bot=False, first_name="なるみ", username="narumi")
-    message = Mock(spec=Message)
-    message.from_user = user
+def test_parse_urls_finds_all_urls():
+    text = "See https://example1.com and https://example2.com"
 
-    result = get_user_display_name(message)
-    assert result == "なるみ(narumi)"
+    assert parse_urls(text) == ["https://example1.com", "https://example2.com"]
 
 
-def test_get_user_display_name_without_username():
-    user = User(id=123, is_bot=False, first_name="なるみ")
-    message = Mock(spec=Message)
-    message.from_user = user
-
-    result = get_user_display_name(message)
-    assert result == "なるみ"
-
-
-def test_get_user_display_name_no_user():
-    message = Mock(spec=Message)
-    message.from_user = None
+@pytest.mark.parametrize(
+    ("user", "expected"),
+    [
+        (User(id=123, is_bot=False, first_name="なるみ", username="narumi"), "なるみ(narumi)"),
+        (User(id=123, is_bot=False, first_name="なるみ"), "なるみ"),
+        (None, None),
+    ],
+)
+def test_get_user_display_name(user, expected):
+    message = SimpleNamespace(from_user=user)
 
-    result = get_user_display_name(message)
-    assert result is None
+    assert get_user_display_name(message) == expected
 
 
 def test_get_message_text_simple(test_user: User):
-    message = Mock(spec=Message)
-    message.text = "Hello world"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("Hello world", test_user)
 
     result = get_message_text(message)
     assert result == "Hello world"
 
 
 def test_get_message_text_with_command(test_user: User):
-    message = Mock(spec=Message)
-    message.text = "/translate Hello world"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("/translate Hello world", test_user)
 
     result = get_message_text(message)
     assert result == "Hello world"
 
 
 def test_get_message_text_with_user_name(test_user: User):
-    message = Mock(spec=Message)
-    message.text = "Hello world"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("Hello world", test_user)
 
     result = get_message_text(message, include_user_name=True)
     assert result == "TestUser(testuser): Hello world"
 
 
 def test_get_message_text_with_reply(test_user: User):
-    reply_message = Mock(spec=Message)
-    reply_message.text = "Original message"
-    reply_message.caption = None
-    reply_message.from_user = test_user
-    reply_message.reply_to_message = None
-
-    message = Mock(spec=Message)
-    message.text = "Reply message"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = reply_message
+    reply_message = _build_message("Original message", test_user)
+    message = _build_message("Reply message", test_user, reply_to_message=reply_message)
 
     result = get_message_text(message)
     assert result == "Original message\n\nReply message"
 
 
 def test_get_message_text_empty(test_user: User):
-    message = Mock(spec=Message)
-    message.text = None
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message(None, test_user)
 
     result = get_message_text(message)
     assert result == ""
 
 
-def test_get_message_key():
-    message = Mock(spec=Message)
-    message.message_id = 123
-    message.chat = Mock()
-    message.chat.id = 456
+def test_get_message_key(test_chat: Chat):
+    message = SimpleNamespace(
+        message_id=123,
+        chat=test_chat,
+    )
 
     result = get_message_key(message)
     assert result == "123:456"
 
 
-@pytest.mark.asyncio
 async def test_no_message_text(test_user: User):
-    message = Mock(spec=Message)
-    message.text = ""
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("", test_user)
 
     text, error = await get_processed_message_text(message, require_url=False)
     assert text is None
     assert error is None
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
 async def test_command_only_reply_to_url_message(mock_parse_urls, mock_load_url, test_user: User):
     """Replying to a URL-only message with a bare command (e.g. /f) should process the reply URL."""
     mock_parse_urls.return_value = ["https://example.com"]
     mock_load_url.return_value = "Loaded content"
 
-    reply_message = Mock(spec=Message)
-    reply_message.text = "https://example.com"
-    reply_message.caption = None
-    reply_message.from_user = test_user
-    reply_message.reply_to_message = None
+    reply_message = _build_message("https://example.com", test_user)
 
-    message = Mock(spec=Message)
-    message.text = "/f"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = reply_message
+    message = _build_message("/f", test_user, reply_to_message=reply_message)
 
     text, error = await get_processed_message_text(message, require_url=False, include_reply_to_message=True)
 
@@ -173,50 +136,35 @@ async def test_command_only_reply_to_url_message(mock_parse_urls, mock_load_url,
     mock_load_url.assert_called_once_with("https://example.com")
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "parse_urls")
 async def test_require_url_but_no_url(mock_parse_urls, test_user: User):
     mock_parse_urls.return_value = []
 
-    message = Mock(spec=Message)
-    message.text = "No URL here"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("No URL here", test_user)
 
     text, error = await get_processed_message_text(message, require_url=True)
     assert text is None
     assert error is None
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "parse_urls")
 async def test_no_url_returns_original_text(mock_parse_urls, test_user: User):
     mock_parse_urls.return_value = []
 
-    message = Mock(spec=Message)
-    message.text = "No URL here"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("No URL here", test_user)
 
     text, error = await get_processed_message_text(message, require_url=False)
     assert text == "No URL here"
     assert error is None
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
 async def test_url_loading_success(mock_parse_urls, mock_load_url, test_user: User):
     mock_parse_urls.return_value = ["https://example.com"]
     mock_load_url.return_value = "Content from URL"
 
-    message = Mock(spec=Message)
-    message.text = "https://example.com"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("https://example.com", test_user)
 
     text, error = await get_processed_message_text(message, require_url=False)
     assert text == "https://example.com\n\nURL content from https://example.com:\nContent from URL"
@@ -224,36 +172,26 @@ async def test_url_loading_success(mock_parse_urls, mock_load_url, test_user: Us
     mock_load_url.assert_called_once_with("https://example.com")
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
 async def test_url_loading_failure(mock_parse_urls, mock_load_url, test_user: User):
     mock_parse_urls.return_value = ["https://example.com"]
     mock_load_url.side_effect = Exception("Connection error")
 
-    message = Mock(spec=Message)
-    message.text = "https://example.com"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("https://example.com", test_user)
 
     text, error = await get_processed_message_text(message, require_url=False)
     assert text is None
     assert error == "Failed to load URL(s): https://example.com"
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
 async def test_require_url_with_url_success(mock_parse_urls, mock_load_url, test_user: User):
     mock_parse_urls.return_value = ["https://example.com"]
     mock_load_url.return_value = "Content from URL"
 
-    message = Mock(spec=Message)
-    message.text = "https://example.com"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("https://example.com", test_user)
 
     text, error = await get_processed_message_text(message, require_url=True)
     assert text == "https://example.com\n\nURL content from https://example.com:\nContent from URL"
@@ -261,18 +199,17 @@ async def test_require_url_with_url_success(mock_parse_urls, mock_load_url, test
     mock_load_url.assert_called_once_with("https://example.com")
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
 async def test_multiple_urls_loading_success(mock_parse_urls, mock_load_url, test_user: User):
     mock_parse_urls.return_value = ["https://example1.com", "https://example2.com"]
-    mock_load_url.side_effect = ["Content from URL 1", "Content from URL 2"]
+    # URLs are loaded concurrently, so map each URL to its content instead of relying on call order.
+    mock_load_url.side_effect = {
+        "https://example1.com": "Content from URL 1",
+        "https://example2.com": "Content from URL 2",
+    }.get
 
-    message = Mock(spec=Message)
-    message.text = "Check https://example1.com and https://example2.com"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("Check https://example1.com and https://example2.com", test_user)
 
     text, error = await get_processed_message_text(message, require_url=False)
     assert text == (
@@ -284,36 +221,72 @@ async def test_multiple_urls_loading_success(mock_parse_urls, mock_load_url, tes
     assert mock_load_url.call_count == 2
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
 async def test_multiple_urls_one_fails(mock_parse_urls, mock_load_url, test_user: User):
     mock_parse_urls.return_value = ["https://example1.com", "https://example2.com"]
     mock_load_url.side_effect = Exception("Connection error")
 
-    message = Mock(spec=Message)
-    message.text = "Check https://example1.com and https://example2.com"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("Check https://example1.com and https://example2.com", test_user)
 
     text, error = await get_processed_message_text(message, require_url=False)
     assert text is None
     assert error == "Failed to load URL(s): https://example1.com, https://example2.com"
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
+async def test_multiple_urls_reports_only_failed_urls(mock_parse_urls, mock_load_url, test_user: User):
+    mock_parse_urls.return_value = ["https://example1.com", "https://example2.com"]
+
+    async def load_url(url: str) -> str:
+        if url == "https://example2.com":
+            raise Exception("Connection error")
+        return "Content from URL 1"
+
+    mock_load_url.side_effect = load_url
+
+    message = _build_message("Check https://example1.com and https://example2.com", test_user)
+
+    text, error = await get_processed_message_text(message, require_url=False)
+    assert text is None
+    assert error == "Failed to load URL(s): https://example2.com"
+    assert mock_load_url.call_count == 2
+
+
+class _NonExceptionError(BaseException):
+    pass
+
+
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
+async def test_non_exception_errors_propagate_from_url_loading(mock_parse_urls, mock_load_url, test_user: User):
+    mock_parse_urls.return_value = ["https://example1.com", "https://example2.com"]
+
+    async def load_url(url: str) -> str:
+        if url == "https://example2.com":
+            raise _NonExceptionError
+        return "Content from URL 1"
+
+    mock_load_url.side_effect = load_url
+
+    message = _build_message("Check https://example1.com and https://example2.com", test_user)
+
+    with pytest.raises(_NonExceptionError):
+        await get_processed_message_text(message, require_url=False)
+
+
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
 async def test_multiple_urls_require_url(mock_parse_urls, mock_load_url, test_user: User):
     mock_parse_urls.return_value = ["https://example1.com", "https://example2.com", "https://example3.com"]
-    mock_load_url.side_effect = ["Content 1", "Content 2", "Content 3"]
+    mock_load_url.side_effect = {
+        "https://example1.com": "Content 1",
+        "https://example2.com": "Content 2",
+        "https://example3.com": "Content 3",
+    }.get
 
-    message = Mock(spec=Message)
-    message.text = "Three URLs: https://example1.com https://example2.com https://example3.com"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = None
+    message = _build_message("Three URLs: https://example1.com https://example2.com https://example3.com", test_user)
 
     text, error = await get_processed_message_text(message, require_url=True)
     assert text == (
@@ -326,22 +299,12 @@ async def test_multiple_urls_require_url(mock_parse_urls, mock_load_url, test_us
     assert mock_load_url.call_count == 3
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "parse_urls")
 async def test_include_reply_to_message_true_includes_reply_content(mock_parse_urls, test_user: User):
     mock_parse_urls.return_value = []
 
-    reply_message = Mock(spec=Message)
-    reply_message.text = "Original message"
-    reply_message.caption = None
-    reply_message.from_user = test_user
-    reply_message.reply_to_message = None
-
-    message = Mock(spec=Message)
-    message.text = "Reply message"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = reply_message
+    reply_message = _build_message("Original message", test_user)
+    message = _build_message("Reply message", test_user, reply_to_message=reply_message)
 
     text, error = await get_processed_message_text(
         message,
@@ -354,9 +317,8 @@ async def test_include_reply_to_message_true_includes_reply_content(mock_parse_u
     mock_parse_urls.assert_called_once_with("Replied message:\nOriginal message\n\nCurrent message:\nReply message")
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
 async def test_reply_message_with_current_url_keeps_sections(
     mock_parse_urls,
     mock_load_url,
@@ -365,17 +327,9 @@ async def test_reply_message_with_current_url_keeps_sections(
     mock_parse_urls.return_value = ["https://example.com"]
     mock_load_url.return_value = "Loaded page"
 
-    reply_message = Mock(spec=Message)
-    reply_message.text = "Bot said hello"
-    reply_message.caption = None
-    reply_message.from_user = test_user
-    reply_message.reply_to_message = None
+    reply_message = _build_message("Bot said hello", test_user)
 
-    message = Mock(spec=Message)
-    message.text = "Please summarize https://example.com"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = reply_message
+    message = _build_message("Please summarize https://example.com", test_user, reply_to_message=reply_message)
 
     text, error = await get_processed_message_text(message, require_url=False, include_reply_to_message=True)
 
@@ -387,24 +341,15 @@ async def test_reply_message_with_current_url_keeps_sections(
     assert error is None
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.load_url")
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "load_url")
+@patch.object(utils, "parse_urls")
 async def test_reply_message_with_reply_url_keeps_original_sections(mock_parse_urls, mock_load_url, test_user: User):
     mock_parse_urls.return_value = ["https://example.com"]
     mock_load_url.return_value = "Loaded page"
 
-    reply_message = Mock(spec=Message)
-    reply_message.text = "Context https://example.com"
-    reply_message.caption = None
-    reply_message.from_user = test_user
-    reply_message.reply_to_message = None
+    reply_message = _build_message("Context https://example.com", test_user)
 
-    message = Mock(spec=Message)
-    message.text = "What does this mean?"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = reply_message
+    message = _build_message("What does this mean?", test_user, reply_to_message=reply_message)
 
     text, error = await get_processed_message_text(message, require_url=False, include_reply_to_message=True)
 
@@ -416,22 +361,12 @@ async def test_reply_message_with_reply_url_keeps_original_sections(mock_parse_u
     assert error is None
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.utils.parse_urls")
+@patch.object(utils, "parse_urls")
 async def test_include_reply_to_message_false_excludes_reply_content(mock_parse_urls, test_user: User):
     mock_parse_urls.return_value = []
 
-    reply_message = Mock(spec=Message)
-    reply_message.text = "Original message"
-    reply_message.caption = None
-    reply_message.from_user = test_user
-    reply_message.reply_to_message = None
-
-    message = Mock(spec=Message)
-    message.text = "Reply message"
-    message.caption = None
-    message.from_user = test_user
-    message.reply_to_message = reply_message
+    reply_message = _build_message("Original message", test_user)
+    message = _build_message("Reply message", test_user, reply_to_message=reply_message)
 
     text, error = await get_processed_message_text(
         message,
@@ -444,9 +379,8 @@ async def test_include_reply_to_message_false_excludes_reply_content(mock_parse_
     mock_parse_urls.assert_called_once_with("Reply message")
 
 
-@pytest.mark.asyncio
 async def test_safe_callback_normal_execution():
-    mock_message = Mock(spec=Message)
+    mock_message = make_message()
 
     @safe_callback
     async def test_callback(message):
@@ -456,10 +390,9 @@ async def test_safe_callback_normal_execution():
     assert result == "success"
 
 
-@pytest.mark.asyncio
 async def test_safe_callback_exception_handling():
-    mock_message = Mock(spec=Message)
-    mock_message.answer = AsyncMock()
+    mock_message = make_message()
+    mock_message.answer = noop_async_mock()
 
     @safe_callback
     async def test_callback(message):
@@ -468,16 +401,14 @@ async def test_safe_callback_exception_handling():
     with pytest.raises(ValueError):
         await test_callback(mock_message)
 
-    mock_message.answer.assert_called_once()
-    call_args = mock_message.answer.call_args[0][0]
-    assert "抱歉" in call_args
-    assert "錯誤" in call_args
+    mock_message.answer.assert_called_once_with(
+        "抱歉，處理您的請求時發生錯誤，請稍後再試。\n如果問題持續發生，請聯絡管理員。"
+    )
 
 
-@pytest.mark.asyncio
 async def test_safe_callback_exception_handling_with_keyword_message():
-    mock_message = Mock(spec=Message)
-    mock_message.answer = AsyncMock()
+    mock_message = make_message()
+    mock_message.answer = noop_async_mock()
 
     @safe_callback
     async def test_callback(message):
@@ -489,10 +420,10 @@ async def test_safe_callback_exception_handling_with_keyword_message():
     mock_message.answer.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_safe_callback_answer_fails():
-    mock_message = Mock(spec=Message)
-    mock_message.answer = AsyncMock(side_effect=Exception("Reply failed"))
+    mock_message = make_message()
+    # Raising at call time exercises the same except branch without building a coroutine.
+    mock_message.answer = Mock(side_effect=Exception("Reply failed"))
 
     @safe_callback
     async def test_callback(message):
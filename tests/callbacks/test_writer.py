@@ -2,16 +2,16 @@ from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
-import pytest
 from aiogram.filters import CommandObject
-from aiogram.types import Message
 
+from bot.callbacks import writer
 from bot.callbacks.writer import writer_callback
+from tests.callbacks.helpers import make_message
+from tests.callbacks.helpers import noop_async_mock
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.writer.write_article", new_callable=AsyncMock)
-@patch("bot.callbacks.writer.get_processed_message_text", new_callable=AsyncMock)
+@patch.object(writer, "write_article", new_callable=AsyncMock)
+@patch.object(writer, "get_processed_message_text", new_callable=AsyncMock)
 async def test_writer_callback_replies_with_created_page_url(mock_get_processed_message_text, mock_write_article):
     mock_get_processed_message_text.return_value = ("整理這段內容", None)
 
@@ -19,9 +19,9 @@ async def test_writer_callback_replies_with_created_page_url(mock_get_processed_
     article.reply = AsyncMock()
     mock_write_article.return_value = article
 
-    message = Mock(spec=Message)
-    message.reply = AsyncMock()
-    message.answer = AsyncMock()
+    message = make_message()
+    message.reply = noop_async_mock()
+    message.answer = noop_async_mock()
 
     await writer_callback(message, Mock(spec=CommandObject))
 
@@ -31,14 +31,13 @@ async def test_writer_callback_replies_with_created_page_url(mock_get_processed_
     message.answer.assert_not_called()
 
 
-@pytest.mark.asyncio
-@patch("bot.callbacks.writer.get_processed_message_text", new_callable=AsyncMock)
+@patch.object(writer, "get_processed_message_text", new_callable=AsyncMock)
 async def test_writer_callback_error_keeps_message_answer(mock_get_processed_message_text):
     mock_get_processed_message_text.return_value = (None, "something went wrong")
 
-    message = Mock(spec=Message)
-    message.reply = AsyncMock()
-    message.answer = AsyncMock()
+    message = make_message()
+    message.reply = noop_async_mock()
+    message.answer = noop_async_mock()
 
     await writer_callback(message, Mock(spec=CommandObject))
 
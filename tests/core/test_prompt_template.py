@@ -0,0 +1,22 @@
+from bot.core.prompt_template import PromptTemplate
+
+
+def test_prompt_template_render_normalizes_template():
+    template = PromptTemplate(
+        template="""
+        Translate into {lang}.
+          Keep {lang} formatting.
+        """
+    )
+
+    assert template.render(lang="English") == "Translate into English.\n  Keep English formatting."
+
+
+def test_prompt_template_render_reuses_rendered_prompt():
+    template = PromptTemplate(template="{greeting}, {name}")
+
+    first = template.render(greeting="Hello", name="narumi")
+    second = template.render(name="narumi", greeting="Hello")
+
+    assert first == "Hello, narumi"
+    assert first is second
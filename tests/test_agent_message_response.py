@@ -18,7 +18,6 @@ def mock_message():
     return message, sent_message
 
 
-@pytest.mark.asyncio
 async def test_message_response_reply_uses_message_reply(mock_message):
     message, sent_message = mock_message
     response = MessageResponse(content="Hello")
@@ -33,7 +32,17 @@ async def test_message_response_reply_uses_message_reply(mock_message):
     )
 
 
-@pytest.mark.asyncio
+@patch("bot.core.message_response.async_create_page", new_callable=AsyncMock)
+async def test_message_response_reply_short_content_skips_telegraph(mock_create_page, mock_message):
+    message, _sent_message = mock_message
+    response = MessageResponse(content="abc")
+
+    with patch.object(message_response_module.settings, "max_message_length", 3):
+        await response.reply(message)
+
+    mock_create_page.assert_not_called()
+
+
 @patch("bot.core.message_response.async_create_page", new_callable=AsyncMock)
 async def test_message_response_reply_long_content_uses_message_reply(mock_create_page, mock_message):
     message, sent_message = mock_message
@@ -51,7 +60,6 @@ async def test_message_response_reply_long_content_uses_message_reply(mock_creat
     )
 
 
-@pytest.mark.asyncio
 @patch.object(Article, "create_page", new_callable=AsyncMock)
 async def test_article_reply_uses_message_reply(mock_create_page, mock_message):
     message, sent_message = mock_message
@@ -6,66 +6,44 @@ from bot.bot import get_chat_filter
 from bot.settings import settings
 
 
-def test_get_chat_filter_no_whitelist(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test chat filter when no whitelist is specified - allows all"""
-    monkeypatch.setattr(settings, "bot_whitelist", None)
-    chat_filter = get_chat_filter()
-    # Should allow any message
-    mock_message = Mock()
-    mock_message.chat.id = 12345
-    assert chat_filter(mock_message) is True
+@pytest.fixture
+def mock_message() -> Mock:
+    return Mock()
 
 
-def test_get_chat_filter_empty_whitelist(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test chat filter when whitelist is empty - allows all"""
-    monkeypatch.setattr(settings, "bot_whitelist", "")
+@pytest.mark.parametrize("whitelist", [None, ""])
+def test_get_chat_filter_allows_all_without_whitelist(
+    monkeypatch: pytest.MonkeyPatch, mock_message: Mock, whitelist: str | None
+) -> None:
+    """Test chat filter when no whitelist is specified - allows all"""
+    monkeypatch.setattr(settings, "bot_whitelist", whitelist)
     chat_filter = get_chat_filter()
-    # Should allow any message
-    mock_message = Mock()
     mock_message.chat.id = 12345
     assert chat_filter(mock_message) is True
 
 
-def test_get_chat_filter_single_chat(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test chat filter with single chat ID"""
-    monkeypatch.setattr(settings, "bot_whitelist", "123456789")
-    chat_filter = get_chat_filter()
-    # Should allow whitelisted chat
-    mock_message = Mock()
-    mock_message.chat.id = 123456789
-    assert chat_filter(mock_message) is True
-    # Should reject non-whitelisted chat
-    mock_message.chat.id = 999999999
-    assert chat_filter(mock_message) is False
-
-
-def test_get_chat_filter_multiple_chats(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test chat filter with multiple chat IDs"""
-    monkeypatch.setattr(settings, "bot_whitelist", "123456789,987654321")
+@pytest.mark.parametrize(
+    ("whitelist", "chat_id", "expected"),
+    [
+        ("123456789", 123456789, True),
+        ("123456789", 999999999, False),
+        ("123456789,987654321", 123456789, True),
+        ("123456789,987654321", 987654321, True),
+        ("123456789,987654321", 111111111, False),
+        ("123456789, 987654321, 555666777", 123456789, True),
+        ("123456789, 987654321, 555666777", 987654321, True),
+        ("123456789, 987654321, 555666777", 555666777, True),
+        ("123456789, 987654321, 555666777", 111111111, False),
+    ],
+)
+def test_get_chat_filter_with_whitelist(
+    monkeypatch: pytest.MonkeyPatch, mock_message: Mock, whitelist: str, chat_id: int, expected: bool
+) -> None:
+    """Test chat filter against single, multiple, and space-separated chat IDs"""
+    monkeypatch.setattr(settings, "bot_whitelist", whitelist)
     chat_filter = get_chat_filter()
-    # Should allow both whitelisted chats
-    mock_message = Mock()
-    mock_message.chat.id = 123456789
-    assert chat_filter(mock_message) is True
-    mock_message.chat.id = 987654321
-    assert chat_filter(mock_message) is True
-    # Should reject non-whitelisted chat
-    mock_message.chat.id = 111111111
-    assert chat_filter(mock_message) is False
-
-
-def test_get_chat_filter_with_spaces(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test chat filter with spaces in whitelist"""
-    monkeypatch.setattr(settings, "bot_whitelist", "123456789, 987654321, 555666777")
-    chat_filter = get_chat_filter()
-    # Should allow all whitelisted chats
-    mock_message = Mock()
-    for chat_id in [123456789, 987654321, 555666777]:
-        mock_message.chat.id = chat_id
-        assert chat_filter(mock_message) is True
-    # Should reject non-whitelisted chat
-    mock_message.chat.id = 111111111
-    assert chat_filter(mock_message) is False
+    mock_message.chat.id = chat_id
+    assert chat_filter(mock_message) is expected
 
 
 def test_get_chat_filter_invalid_chat_id(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -73,3 +51,11 @@ def test_get_chat_filter_invalid_chat_id(monkeypatch: pytest.MonkeyPatch) -> Non
     monkeypatch.setattr(settings, "bot_whitelist", "invalid_id")
     with pytest.raises(ValueError):
         get_chat_filter()
+
+
+@pytest.mark.parametrize("whitelist", [",", " , ", " "])
+def test_get_chat_filter_whitelist_without_ids_fails_closed(monkeypatch: pytest.MonkeyPatch, whitelist: str) -> None:
+    """Test that a non-empty whitelist with no chat IDs raises instead of allowing all chats"""
+    monkeypatch.setattr(settings, "bot_whitelist", whitelist)
+    with pytest.raises(ValueError):
+        get_chat_filter()
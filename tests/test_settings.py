@@ -0,0 +1,40 @@
+import pytest
+from pydantic import ValidationError
+
+from bot.settings import Settings
+from bot.settings import _parse_chat_ids
+
+
+@pytest.fixture(autouse=True)
+def clear_chat_ids_cache():
+    _parse_chat_ids.cache_clear()
+    yield
+    _parse_chat_ids.cache_clear()
+
+
+def test_chat_ids_parses_whitelist_once():
+    settings = Settings(bot_whitelist="123, 456")
+
+    assert settings.chat_ids == [123, 456]
+    assert settings.chat_ids == [123, 456]
+    assert _parse_chat_ids.cache_info().misses == 1
+
+
+def test_chat_ids_returns_independent_lists():
+    settings = Settings(bot_whitelist="123")
+
+    settings.chat_ids.append(456)
+
+    assert settings.chat_ids == [123]
+
+
+def test_chat_ids_ignores_whitespace_and_trailing_comma():
+    settings = Settings(bot_whitelist="123,\t456 ,\n789,")
+
+    assert settings.chat_ids == [123, 456, 789]
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_agent_chunk_concurrency_must_be_positive(concurrency: int):
+    with pytest.raises(ValidationError):
+        Settings(agent_chunk_concurrency=concurrency)
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from bot.utils.chunk import recursive_chunk
@@ -80,3 +82,13 @@ def test_chunk_edge_case_exact_length() -> None:
     text = "exact"  # 5 characters
     result = recursive_chunk(text, chunk_size=5)
     assert result == ["exact"]
+
+
+def test_chunk_short_text_skips_chunker() -> None:
+    """Test that text within chunk_size is returned as-is without chunking"""
+    text = "line one\n\nline two"
+    with patch("bot.utils.chunk._get_chunker") as mock_get_chunker:
+        result = recursive_chunk(text, chunk_size=len(text))
+
+    assert result == [text]
+    mock_get_chunker.assert_not_called()
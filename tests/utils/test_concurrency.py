@@ -0,0 +1,21 @@
+import asyncio
+
+from bot.utils.concurrency import gather_with_limit
+
+
+async def test_gather_with_limit_bounds_in_flight_and_keeps_order():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def work(value: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return value
+
+    results = await gather_with_limit([work(i) for i in range(5)], 2)
+
+    assert results == [0, 1, 2, 3, 4]
+    assert max_in_flight == 2
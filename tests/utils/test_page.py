@@ -0,0 +1,39 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from bot.utils import page
+from bot.utils.page import async_create_page
+from bot.utils.page import get_telegraph_client
+
+
+@pytest.fixture(autouse=True)
+def reset_telegraph_client(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(page, "_telegraph_client", None)
+
+
+@patch("telegraph.Telegraph")
+def test_get_telegraph_client_creates_account_once(mock_telegraph):
+    first = get_telegraph_client()
+    second = get_telegraph_client()
+
+    assert first is second
+    assert mock_telegraph.call_count == 1
+    assert mock_telegraph.return_value.create_account.call_count == 1
+
+
+@patch("telegraph.Telegraph")
+async def test_concurrent_async_create_page_creates_account_once(mock_telegraph):
+    client = mock_telegraph.return_value
+    # Slow account creation widens the window in which concurrent first uploads could race.
+    client.create_account.side_effect = lambda **kwargs: time.sleep(0.05)
+    client.create_page.return_value = {"url": "https://telegra.ph/page"}
+
+    urls = await asyncio.gather(*[async_create_page(title="t", html_content="<p>x</p>") for _ in range(5)])
+
+    assert urls == ["https://telegra.ph/page"] * 5
+    assert mock_telegraph.call_count == 1
+    assert client.create_account.call_count == 1
+    assert client.create_page.call_count == 5
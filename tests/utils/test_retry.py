@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from bot.utils.retry import is_retryable_error
+
+# is_retryable_error only reads `response.status_code`, so plain namespaces shared across tests suffice.
+_REQUEST = SimpleNamespace()
+_RESPONSES = {code: SimpleNamespace(status_code=code) for code in (400, 401, 403, 404, 429, 500, 502, 503)}
+
+
+def _status_error(code: int) -> httpx.HTTPStatusError:
+    return httpx.HTTPStatusError(f"HTTP {code}", request=_REQUEST, response=_RESPONSES[code])
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [(429, True), (500, True), (502, True), (503, True), (400, False), (401, False), (403, False), (404, False)],
+)
+def test_http_status_error_retryability(code: int, expected: bool):
+    assert is_retryable_error(_status_error(code)) is expected
+
+
+def test_network_errors_are_retryable():
+    assert is_retryable_error(httpx.ReadTimeout("read timed out")) is True
+    assert is_retryable_error(httpx.ConnectError("connection refused")) is True
+
+
+def test_unrelated_errors_are_not_retryable():
+    assert is_retryable_error(ValueError("bad input")) is False